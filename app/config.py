@@ -2,7 +2,40 @@
 Configuration settings for the FastAPI Guardrails service.
 """
 
-from typing import Dict, Set
+import os
+from typing import Any, Dict, FrozenSet, Set
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean setting from the environment ("1", "true" or "yes")."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes")
+
+
+# cgroup v2 CPU limit of the container, as "<quota> <period>" or "max <period>"
+_CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+
+
+def _available_cpus() -> int:
+    """
+    Count the CPUs this process may use: its CPU affinity, lowered to the
+    cgroup CPU quota (e.g. `docker run --cpus`), rather than the host's cores.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    try:
+        with open(_CGROUP_CPU_MAX) as cpu_max:
+            quota, period = cpu_max.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(int(quota) // int(period), 1))
+    except (OSError, ValueError):
+        pass
+    return cpus
 
 
 class Settings:
@@ -17,11 +50,53 @@ class Settings:
     )
 
     # Server Settings
-    HOST: str = "0.0.0.0"
-    PORT: int = 8000
-
-    # CORS Settings
-    ALLOW_ORIGINS: list = ["*"]
+    HOST: str = os.getenv("HOST", "0.0.0.0")
+    PORT: int = int(os.getenv("PORT", 8000))
+    # Uvicorn worker processes when started with `python -m app.main`
+    WORKERS: int = int(os.getenv("WEB_CONCURRENCY", _available_cpus()))
+    # Auto-reload on code changes (single worker, development only)
+    DEBUG: bool = _env_flag("DEBUG", False)
+
+    # Load and warm the common validators at startup
+    WARMUP_VALIDATORS: bool = _env_flag("WARMUP_VALIDATORS", True)
+
+    # Run every validator through a guardrails Guard instead of calling it directly
+    VALIDATE_WITH_GUARD: bool = _env_flag("VALIDATE_WITH_GUARD", False)
+
+    # Validator instances kept built, one per distinct (name, config); the
+    # least recently used are dropped first
+    VALIDATOR_CACHE_SIZE: int = int(os.getenv("VALIDATOR_CACHE_SIZE", 128))
+    # The same for validators in MODEL_VALIDATORS, each of which holds its own
+    # copy of a model, kept per process (and per CPU worker process)
+    MODEL_VALIDATOR_CACHE_SIZE: int = int(os.getenv("MODEL_VALIDATOR_CACHE_SIZE", 4))
+
+    # Worker processes for CPU-bound validators (0 runs them in threads
+    # instead); by default the available CPUs are shared out between the
+    # Uvicorn workers, counted from WEB_CONCURRENCY (Uvicorn's default for
+    # --workers, also set by app.main for its workers), and capped at 4 since
+    # every worker process loads its own models at startup
+    CPU_WORKERS: int = int(os.getenv(
+        "CPU_WORKERS",
+        min(max(_available_cpus() // int(os.getenv("WEB_CONCURRENCY", 1)), 1), 4)
+    ))
+
+    # Quantize transformer models of validators to int8 for faster CPU inference
+    QUANTIZE_MODELS: bool = _env_flag("QUANTIZE_MODELS", False)
+
+    # Seconds a RegexMatch pattern may run on the regex module before timing out
+    REGEX_TIMEOUT: float = float(os.getenv("REGEX_TIMEOUT", 0.05))
+
+    # Response cache for repeated /validate requests (size 0 disables it)
+    RESPONSE_CACHE_SIZE: int = int(os.getenv("RESPONSE_CACHE_SIZE", 10_000))
+    RESPONSE_CACHE_TTL: int = int(os.getenv("RESPONSE_CACHE_TTL", 300))
+
+    # CORS Settings (the middleware is only installed when CORS_ENABLED is set)
+    CORS_ENABLED: bool = _env_flag("CORS_ENABLED", False)
+    ALLOW_ORIGINS: list = [
+        origin.strip()
+        for origin in os.getenv("CORS_ALLOW_ORIGINS", "").split(",")
+        if origin.strip()
+    ]
     ALLOW_CREDENTIALS: bool = True
     ALLOW_METHODS: list = ["*"]
     ALLOW_HEADERS: list = ["*"]
@@ -31,34 +106,34 @@ class ValidatorConfig:
     """Configuration for validator requirements and registry."""
 
     # Map of validator names to their required configuration parameters
-    REQUIRED_CONFIGS: Dict[str, Set[str]] = {
-        "RegexMatch": {"regex"},
-        "CompetitorCheck": {"competitors"},
-        "ToxicLanguage": {"threshold", "validation_method"},
-        "GibberishText": {"threshold", "validation_method"},  # Detects gibberish/incoherent text
-        "CorrectLanguage": {"expected_language_iso", "threshold"},  # Validates and translates language
-        "RestrictToTopic": {"valid_topics"},
-        "ReadingTime": {"max_time"},
-        "DetectPII": set(),  # No required params, but may have optional ones
-        "ExcludeSqlPredicates": set(),
-        "ValidLength": {"min", "max"},
-        "ValidRange": {"min", "max"},
-        "ValidChoices": {"choices"},
-        "BugFreePython": set(),
-        "BugFreeSQL": set(),
-        "ExtractedSummarySentencesMatch": set(),
-        "IsHighQualityTranslation": set(),
-        "LowerCase": set(),
-        "OneLine": set(),
-        "TwoWords": set(),
-        "UpperCase": set(),
-        "ValidURL": set(),
-        "SimilarToDocument": {"document", "threshold"},
-        "SimilarToList": {"standard_list", "threshold"},
-        "Provenance": {"validation_method"},
-        "ValidJson": set(),
-        "SecretsPresent": set(),
-        "ToxicityMetrics": set(),
+    REQUIRED_CONFIGS: Dict[str, FrozenSet[str]] = {
+        "RegexMatch": frozenset({"regex"}),
+        "CompetitorCheck": frozenset({"competitors"}),
+        "ToxicLanguage": frozenset({"threshold", "validation_method"}),
+        "GibberishText": frozenset({"threshold", "validation_method"}),  # Detects gibberish/incoherent text
+        "CorrectLanguage": frozenset({"expected_language_iso", "threshold"}),  # Validates and translates language
+        "RestrictToTopic": frozenset({"valid_topics"}),
+        "ReadingTime": frozenset({"max_time"}),
+        "DetectPII": frozenset(),  # No required params, but may have optional ones
+        "ExcludeSqlPredicates": frozenset(),
+        "ValidLength": frozenset({"min", "max"}),
+        "ValidRange": frozenset({"min", "max"}),
+        "ValidChoices": frozenset({"choices"}),
+        "BugFreePython": frozenset(),
+        "BugFreeSQL": frozenset(),
+        "ExtractedSummarySentencesMatch": frozenset(),
+        "IsHighQualityTranslation": frozenset(),
+        "LowerCase": frozenset(),
+        "OneLine": frozenset(),
+        "TwoWords": frozenset(),
+        "UpperCase": frozenset(),
+        "ValidURL": frozenset(),
+        "SimilarToDocument": frozenset({"document", "threshold"}),
+        "SimilarToList": frozenset({"standard_list", "threshold"}),
+        "Provenance": frozenset({"validation_method"}),
+        "ValidJson": frozenset(),
+        "SecretsPresent": frozenset(),
+        "ToxicityMetrics": frozenset(),
     }
 
     # Validators that are commonly available
@@ -81,10 +156,61 @@ class ValidatorConfig:
         "TwoWords",
     }
 
+    # Configs used to build and run expensive validators once at startup,
+    # loading their models before the first request
+    WARMUP_CONFIGS: Dict[str, Dict[str, Any]] = {
+        "ToxicLanguage": {"threshold": 0.5, "validation_method": "sentence"},
+        "DetectPII": {},
+    }
+
+    # Validators running model inference that holds the GIL; these are
+    # dispatched to the worker process pool instead of the thread pool
+    CPU_BOUND_VALIDATORS: Set[str] = {
+        "ToxicLanguage",
+        "Provenance",
+        "DetectPII",
+        "SecretsPresent",
+        "ToxicityMetrics",
+    }
+
+    # Validators that load a model when they are built; cached instances of
+    # these count against MODEL_VALIDATOR_CACHE_SIZE rather than
+    # VALIDATOR_CACHE_SIZE
+    MODEL_VALIDATORS: Set[str] = {
+        "ToxicLanguage",
+        "DetectPII",
+        "GibberishText",
+        "CorrectLanguage",
+        "RestrictToTopic",
+        "Provenance",
+        "ToxicityMetrics",
+        "SimilarToDocument",
+        "SimilarToList",
+        "IsHighQualityTranslation",
+    }
+
+    # Validators running transformers pipelines that support int8 dynamic
+    # quantization (DetectPII uses Presidio/spaCy and has no such model)
+    QUANTIZABLE_VALIDATORS: Set[str] = {
+        "ToxicLanguage",
+        "GibberishText",
+    }
+
+    # Validators whose validate() does not follow the (value, metadata) ->
+    # ValidationResult interface; these are always run through a Guard
+    GUARD_WRAPPED_VALIDATORS: Set[str] = set()
+
+    # Validators whose result may change for the same text and config
+    # (e.g. they call external services); responses using them are not cached
+    NON_CACHEABLE_VALIDATORS: Set[str] = {
+        "Provenance",
+        "RestrictToTopic",
+    }
+
     @classmethod
-    def get_required_configs(cls, validator_name: str) -> Set[str]:
+    def get_required_configs(cls, validator_name: str) -> FrozenSet[str]:
         """Get required configuration parameters for a validator."""
-        return cls.REQUIRED_CONFIGS.get(validator_name, set())
+        return cls.REQUIRED_CONFIGS.get(validator_name, frozenset())
 
     @classmethod
     def validate_config(cls, validator_name: str, config: dict) -> tuple[bool, str]:
@@ -94,12 +220,12 @@ class ValidatorConfig:
         Returns:
             tuple: (is_valid, error_message)
         """
-        required = cls.get_required_configs(validator_name)
+        required = cls.REQUIRED_CONFIGS.get(validator_name)
 
         if not required:
             return True, ""
 
-        missing = required - set(config.keys())
+        missing = [key for key in required if key not in config]
         if missing:
             return False, f"Missing required configuration parameters: {', '.join(missing)}"
 
@@ -0,0 +1,300 @@
+"""
+Faster drop-in replacements for Guardrails Hub validators.
+
+GuardrailValidator substitutes these for the hub validators of the same name
+once the hub validator is installed. They take the same config and give the
+same results and error messages, except that a RegexMatch pattern that runs
+too long times out and non-ASCII text is matched with the Unicode tables of
+the regex module (see _compile_pattern).
+"""
+
+import functools
+import importlib
+import re
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+from guardrails.validator_base import (
+    FailResult,
+    PassResult,
+    ValidationResult,
+    Validator,
+    register_validator,
+)
+
+from app.config import settings
+
+# Optional regex engines, in order of preference
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import regex
+except ImportError:
+    regex = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Syntax that RE2 and re read differently whatever the text: re takes "{,n}"
+# as a quantifier and "[[:" as a literal rather than a POSIX class
+_RE2_UNSAFE = re.compile(r"\{,|\[:")
+
+# ASCII text characters on which RE2 may answer differently from re (RE2
+# only gets ASCII text): re's \s also takes \v and \x1c-\x1f, and re's
+# "$" also matches before a trailing newline
+_RE2_SPACE_DIFFERENCES = re.compile(r"[\x0b\x1c-\x1f]")
+_RE2_DOLLAR_DIFFERENCES = re.compile(r"\n")
+_RE2_BOTH_DIFFERENCES = re.compile(r"[\n\x0b\x1c-\x1f]")
+
+# Inline flags turning on verbose mode, where "[" may sit in a comment
+_VERBOSE_FLAG = re.compile(r"\(\?[a-zA-Z-]*x")
+
+# \s and \S rewritten for the regex module, outside and inside a character
+# class, so that they take \x1c-\x1f as whitespace like re does
+_SPACE_REWRITES = {
+    False: {r"\s": r"[\s\x1c-\x1f]", r"\S": r"[^\s\x1c-\x1f]"},
+    True: {r"\s": r"\s\x1c-\x1f"},
+}
+
+
+def _re2_differences(pattern: str) -> Optional[Pattern]:
+    """
+    Get the ASCII text characters on which RE2 may match a pattern differently
+    from re; None when the two agree on every ASCII text.
+    """
+    space = re.search(r"\\[sS]", pattern) is not None
+    dollar = "$" in pattern
+    if space and dollar:
+        return _RE2_BOTH_DIFFERENCES
+    if space:
+        return _RE2_SPACE_DIFFERENCES
+    if dollar:
+        return _RE2_DOLLAR_DIFFERENCES
+    return None
+
+
+def _regex_pattern(pattern: str) -> str:
+    """
+    Rewrite a pattern for the regex module so it reads ASCII text as re does.
+
+    \\s and \\S also take \\x1c-\\x1f (except \\S inside a character class,
+    which cannot be rewritten without set operations), and "[:" is escaped so
+    that regex does not read POSIX classes, which re does not support.
+    Verbose patterns are left unchanged.
+    """
+    if _VERBOSE_FLAG.search(pattern):
+        return pattern
+
+    parts = []
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        index += 1
+        if char == "\\":
+            escape = char + pattern[index:index + 1]
+            parts.append(_SPACE_REWRITES[in_class].get(escape, escape))
+            index += 1
+        elif char == "[" and not in_class:
+            in_class = True
+            parts.append(char)
+            if pattern.startswith("^", index):
+                parts.append("^")
+                index += 1
+            # A "]" right after "[" or "[^" is a literal, not the end
+            if pattern.startswith("]", index):
+                parts.append("]")
+                index += 1
+            elif pattern.startswith(":", index):
+                parts.append("\\:")
+                index += 1
+        elif char == "[" and pattern.startswith(":", index):
+            parts.append("[\\:")
+            index += 1
+        else:
+            if char == "]":
+                in_class = False
+            parts.append(char)
+
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, match_type: str) -> Callable[[str], Any]:
+    """
+    Compile a user supplied pattern to match as `re` would, in bounded time.
+
+    The pattern is compiled with `re` first, so invalid patterns are rejected
+    as upstream rejects them. Each text is then matched with the linear-time
+    RE2 engine when both pattern and text are ASCII and RE2 is known to give
+    the same answer for them, and otherwise with the `regex` module and a
+    timeout. `regex` follows `re` on ASCII text; on other text its `\\w`,
+    `\\d`, `\\s`, `\\b` and case-insensitive matching use its own, newer
+    Unicode tables (e.g. combining marks are word characters). `re` itself is
+    only used when neither engine is installed.
+
+    Args:
+        pattern: Regular expression from the guardrail config
+        match_type: "fullmatch" or "search"
+
+    Returns:
+        Callable taking the text and returning a match object or None
+    """
+    fallback = getattr(re.compile(pattern), match_type)
+
+    if regex is not None:
+        for regex_source in (_regex_pattern(pattern), pattern):
+            try:
+                fallback = functools.partial(
+                    getattr(regex.compile(regex_source), match_type),
+                    timeout=settings.REGEX_TIMEOUT,
+                )
+                break
+            except regex.error:
+                continue
+
+    if re2 is None or not pattern.isascii() or _RE2_UNSAFE.search(pattern):
+        return fallback
+
+    options = re2.Options()
+    options.log_errors = False
+    try:
+        re2_match = getattr(re2.compile(pattern, options), match_type)
+    except re2.error:
+        # Backreferences, lookarounds and other syntax RE2 does not support
+        return fallback
+    re2_differences = _re2_differences(pattern)
+
+    def match(text: str) -> Any:
+        if text.isascii() and (
+            re2_differences is None or not re2_differences.search(text)
+        ):
+            return re2_match(text)
+        return fallback(text)
+
+    return match
+
+
+@register_validator(name="ai-guard-rails/regex_match", data_type="string")
+class FastRegexMatch(Validator):
+    """
+    RegexMatch with patterns compiled once, on a linear-time engine when possible.
+
+    Results match upstream, which uses `re`; patterns run on the `regex`
+    module that take longer than REGEX_TIMEOUT raise TimeoutError instead.
+    """
+
+    def __init__(
+        self,
+        regex: str,
+        match_type: Optional[str] = None,
+        on_fail: Optional[Any] = None,
+    ):
+        if match_type is None:
+            match_type = "fullmatch"
+        if match_type not in ("fullmatch", "search"):
+            raise ValueError('match_type must be in ["fullmatch", "search"]')
+
+        super().__init__(on_fail=on_fail, match_type=match_type, regex=regex)
+        self._regex = regex
+        self._match = _compile_pattern(regex, match_type)
+
+    def _validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        try:
+            matched = self._match(value)
+        except TimeoutError as e:
+            # Raised rather than returned as a FailResult: a timeout says
+            # nothing about the text, so it must not be cached as a mismatch
+            raise TimeoutError(f"Timed out matching {self._regex}") from e
+
+        if not matched:
+            return FailResult(error_message=f"Result must match {self._regex}")
+        return PassResult()
+
+
+def _fold_case(text: str) -> str:
+    """
+    Lowercase then case-fold text for competitor matching.
+
+    The hub validator looks for each lowercased name in the lowercased text.
+    Lowercasing depends on context only for the Greek final sigma, and case
+    folding maps both sigmas to one letter, so a name the hub validator finds
+    is always found in the folded text too, including names that change
+    length when lowercased (e.g. "İ").
+    """
+    return text.lower().casefold()
+
+
+@functools.lru_cache(maxsize=256)
+def _competitor_matcher(competitors: Tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Build a case-insensitive test for whether any competitor occurs in a text.
+
+    With pyahocorasick all names are found in a single pass over the text;
+    without it each name is checked with a plain substring search. Names are
+    matched anywhere in the text, not only on word boundaries, so the test may
+    report a mention the hub validator ignores but never misses one.
+
+    Args:
+        competitors: Sorted competitor names
+
+    Returns:
+        Callable taking the text and returning True if any name occurs in it
+    """
+    names = [_fold_case(name) for name in competitors if name]
+    if not names:
+        return lambda text: False
+
+    if ahocorasick is None:
+        def mentions_competitor(text: str) -> bool:
+            folded = _fold_case(text)
+            return any(name in folded for name in names)
+        return mentions_competitor
+
+    automaton = ahocorasick.Automaton()
+    for name in names:
+        automaton.add_word(name, name)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(_fold_case(text)), None) is not None
+
+
+@register_validator(name="ai-guard-rails/competitor_check", data_type="string")
+class FastCompetitorCheck(Validator):
+    """
+    CompetitorCheck that skips NER when no competitor name occurs in the text.
+
+    Texts mentioning a competitor are handed to the hub validator unchanged,
+    so pass/fail results are the same as upstream.
+    """
+
+    def __init__(
+        self,
+        competitors: List[str],
+        on_fail: Optional[Any] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(on_fail=on_fail, competitors=competitors, **kwargs)
+        hub_module = importlib.import_module("guardrails.hub")
+        self._validator = hub_module.CompetitorCheck(
+            competitors=competitors,
+            on_fail=on_fail,
+            **kwargs,
+        )
+        self._mentions_competitor = _competitor_matcher(tuple(sorted(competitors)))
+
+    def _validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        if not self._mentions_competitor(value):
+            return PassResult()
+        return self._validator.validate(value, metadata)
+
+
+# Hub validator names mapped to their faster replacements
+FAST_VALIDATORS: Dict[str, Any] = {
+    "RegexMatch": FastRegexMatch,
+    "CompetitorCheck": FastCompetitorCheck,
+}
@@ -2,13 +2,61 @@
 FastAPI application with /validate endpoint for guardrails validation.
 """
 
-from fastapi import FastAPI, HTTPException, status
+import os
+from contextlib import asynccontextmanager
+from hashlib import blake2b
+from typing import Any, Tuple
+
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
+from app.routing import ORJSONRoute
 from app.models import ValidationRequest, ValidationResponse, ErrorResponse
-from app.validators import guardrail_validator
-from app.config import settings
+from app.validators import guardrail_validator, freeze_config
+from app.config import settings, validator_config
+
+
+# Shared response for the common case where every guardrail passed, and its
+# JSON body, encoded once so it can be returned without serialization
+_PASSED_RESPONSE = ValidationResponse(passed=True, failed_guardrails=[])
+_PASSED_BODY = _PASSED_RESPONSE.model_dump_json().encode()
+
+
+def _passed_json_response() -> Response:
+    """Return the pre-encoded all-passed response."""
+    return Response(content=_PASSED_BODY, media_type="application/json")
+
+# Recent /validate responses keyed by text digest and guardrail configs
+_response_cache: TTLCache = TTLCache(
+    maxsize=max(settings.RESPONSE_CACHE_SIZE, 1),
+    ttl=settings.RESPONSE_CACHE_TTL,
+)
+
+
+def _response_cache_key(request: ValidationRequest) -> Tuple[bytes, Tuple[Any, ...]]:
+    """Build the response cache key for a validation request."""
+    text_digest = blake2b(request.text.encode(), digest_size=16).digest()
+    guardrails = tuple(
+        (guardrail.name, freeze_config(guardrail.config))
+        for guardrail in request.guardrails
+    )
+    return text_digest, guardrails
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start the worker processes for CPU-bound validators and warm the common
+    validators on startup; stop the workers on exit.
+    """
+    guardrail_validator.start_process_pool(settings.CPU_WORKERS)
+    try:
+        if settings.WARMUP_VALIDATORS:
+            await guardrail_validator.warm_up()
+        yield
+    finally:
+        guardrail_validator.shutdown_process_pool()
 
 
 # Create FastAPI app
@@ -16,16 +64,21 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description=settings.APP_DESCRIPTION,
+    lifespan=lifespan,
 )
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.ALLOW_ORIGINS,
-    allow_credentials=settings.ALLOW_CREDENTIALS,
-    allow_methods=settings.ALLOW_METHODS,
-    allow_headers=settings.ALLOW_HEADERS,
-)
+# Decode request bodies with orjson; responses keep FastAPI's default class so
+# response models are serialized straight to JSON bytes by Pydantic
+app.router.route_class = ORJSONRoute
+
+# Add CORS middleware only when browser clients need it
+if settings.CORS_ENABLED:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.ALLOW_ORIGINS,
+        allow_credentials=settings.ALLOW_CREDENTIALS,
+        allow_methods=settings.ALLOW_METHODS,
+        allow_headers=settings.ALLOW_HEADERS,
+    )
 
 
 @app.get("/")
@@ -104,10 +157,22 @@ async def validate_text(request: ValidationRequest):
     - passed: Boolean indicating if all validations passed
     - failed_guardrails: List of failed guardrails with error messages (empty if all passed)
     """
+    cache_key = None
+    if settings.RESPONSE_CACHE_SIZE > 0 and not any(
+        guardrail.name in validator_config.NON_CACHEABLE_VALIDATORS
+        for guardrail in request.guardrails
+    ):
+        cache_key = _response_cache_key(request)
+        cached_response = _response_cache.get(cache_key)
+        if cached_response is _PASSED_RESPONSE:
+            return _passed_json_response()
+        if cached_response is not None:
+            return cached_response
+
     try:
-        # Step 1: Validate all guardrail configurations first
-        configs_valid, config_errors = guardrail_validator.validate_all_configs(
-            request.guardrails
+        # Step 1: Validate all guardrail configurations and resolve validators
+        configs_valid, config_errors, resolved_guardrails = (
+            guardrail_validator.resolve_and_validate_configs(request.guardrails)
         )
 
         if not configs_valid:
@@ -120,16 +185,28 @@ async def validate_text(request: ValidationRequest):
             )
 
         # Step 2: Run validation against all guardrails
-        all_passed, failed_guardrails = guardrail_validator.validate_text(
+        all_passed, failed_guardrails = await guardrail_validator.validate_text(
             request.text,
-            request.guardrails
+            resolved_guardrails
         )
 
-        # Step 3: Return results
-        return ValidationResponse(
-            passed=all_passed,
+        # Step 3: Return (and cache) results
+        if all_passed:
+            if cache_key is not None:
+                _response_cache[cache_key] = _PASSED_RESPONSE
+            return _passed_json_response()
+
+        response = ValidationResponse(
+            passed=False,
             failed_guardrails=failed_guardrails
         )
+        # Failures from validator errors or timeouts may not recur, so only
+        # responses that are purely about the text are cached
+        if cache_key is not None and not any(
+            failed_guardrail.is_error for failed_guardrail in failed_guardrails
+        ):
+            _response_cache[cache_key] = response
+        return response
 
     except HTTPException:
         # Re-raise HTTP exceptions
@@ -146,22 +223,20 @@ async def validate_text(request: ValidationRequest):
         )
 
 
-# Custom exception handler for better error responses
-@app.exception_handler(HTTPException)
-async def http_exception_handler(request, exc: HTTPException):
-    """Custom handler for HTTP exceptions."""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"detail": exc.detail}
-    )
-
-
 if __name__ == "__main__":
     import uvicorn
+    workers = 1 if settings.DEBUG else settings.WORKERS
+    # Worker processes read this to size their CPU_WORKERS share
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    # uvloop and httptools come with uvicorn[standard]; each worker warms its
+    # validators in the lifespan handler before accepting requests
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=True
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        reload=settings.DEBUG
     )
 
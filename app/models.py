@@ -3,7 +3,7 @@ Pydantic models for validation requests and responses.
 """
 
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class GuardrailConfig(BaseModel):
@@ -18,9 +18,12 @@ class GuardrailConfig(BaseModel):
     @field_validator('name')
     @classmethod
     def name_not_empty(cls, v: str) -> str:
-        if not v or not v.strip():
+        # isspace() is False for "", hence the explicit empty check
+        if not v or v.isspace():
             raise ValueError("Guardrail name cannot be empty")
-        return v.strip()
+        if v[0].isspace() or v[-1].isspace():
+            return v.strip()
+        return v
 
 
 class ValidationRequest(BaseModel):
@@ -36,7 +39,7 @@ class ValidationRequest(BaseModel):
     @field_validator('text')
     @classmethod
     def text_not_empty(cls, v: str) -> str:
-        if not v or not v.strip():
+        if not v or v.isspace():
             raise ValueError("Text cannot be empty")
         return v
 
@@ -64,6 +67,23 @@ class FailedGuardrail(BaseModel):
 
     name: str = Field(..., description="Name of the failed guardrail")
     error: str = Field(..., description="Error message describing the failure")
+    # Set when the guardrail failed because validating raised or timed out
+    # rather than because of the text; not part of the response body
+    _is_error: bool = PrivateAttr(default=False)
+
+    model_config = {"frozen": True, "extra": "forbid"}
+
+    @classmethod
+    def from_error(cls, name: str, error: str) -> "FailedGuardrail":
+        """Build a FailedGuardrail for an error raised while validating."""
+        failed = cls(name=name, error=error)
+        failed._is_error = True
+        return failed
+
+    @property
+    def is_error(self) -> bool:
+        """Whether the failure came from an error, which may not recur on retry."""
+        return self._is_error
 
 
 class ValidationResponse(BaseModel):
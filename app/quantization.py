@@ -0,0 +1,58 @@
+"""
+Dynamic int8 quantization for validators backed by transformers models.
+"""
+
+import threading
+from typing import Any, Dict
+
+# Quantized models by model name, shared by every validator in this process
+_quantized_models: Dict[str, Any] = {}
+_quantized_lock = threading.Lock()
+
+
+def _quantize_model(model: Any) -> Any:
+    """
+    Return an int8 dynamically quantized copy of a CPU torch model.
+
+    Args:
+        model: transformers model held by a pipeline
+
+    Returns:
+        Quantized model, or the original model if it is not on the CPU
+    """
+    import torch
+
+    if model.device.type != "cpu":
+        return model
+
+    key = getattr(model, "name_or_path", "") or str(id(model))
+    with _quantized_lock:
+        quantized = _quantized_models.get(key)
+        if quantized is None:
+            quantized = torch.ao.quantization.quantize_dynamic(
+                model,
+                {torch.nn.Linear},
+                dtype=torch.qint8,
+            )
+            _quantized_models[key] = quantized
+    return quantized
+
+
+def quantize_validator_models(validator_instance: Any) -> None:
+    """
+    Swap the models of a validator's transformers pipelines for int8 versions.
+
+    Linear layers are quantized dynamically, which roughly halves memory and
+    speeds up CPU inference. Scores can shift slightly, so this is opt-in.
+
+    Args:
+        validator_instance: Validator whose pipelines should be quantized
+    """
+    try:
+        from transformers import Pipeline
+    except ImportError:
+        return
+
+    for attribute in vars(validator_instance).values():
+        if isinstance(attribute, Pipeline):
+            attribute.model = _quantize_model(attribute.model)
@@ -2,20 +2,116 @@
 Guardrails validator registry and validation logic.
 """
 
+import asyncio
+import functools
 import importlib
-from typing import List, Dict, Any, Tuple, Optional
+import inspect
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, List, Dict, Any, Tuple, Optional
+from cachetools import LRUCache
 from guardrails import Guard, OnFailAction
 from guardrails.errors import ValidationError
+from guardrails.validator_base import FailResult
 
 from app.models import GuardrailConfig, FailedGuardrail
-from app.config import validator_config
+from app.config import settings, validator_config
+from app.fast_validators import FAST_VALIDATORS
+from app.quantization import quantize_validator_models
+
+
+logger = logging.getLogger(__name__)
+
+# Shared pool for running the synchronous validator calls off the event loop,
+# so the guardrails of a single request are checked concurrently.
+_executor = ThreadPoolExecutor(
+    max_workers=(os.cpu_count() or 1) * 4,
+    thread_name_prefix="guardrail",
+)
+
+# Patterns used to convert CamelCase validator names to snake_case module names
+_CAMEL1 = re.compile(r'(.)([A-Z][a-z]+)')
+_CAMEL2 = re.compile(r'([a-z0-9])([A-Z])')
+
+# guardrails.hub is imported once here so lookups never re-enter the import
+# machinery (and its global lock) just to fetch the module
+_HUB = importlib.import_module("guardrails.hub")
+
+# Validator names remembered as missing; the names come from clients, so
+# only the most recently requested ones are kept
+_MISSING_CACHE_SIZE = 1024
+
+
+def freeze_config(value: Any) -> Any:
+    """Recursively convert a config value into a hashable equivalent."""
+    if isinstance(value, dict):
+        return frozenset((key, freeze_config(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_config(item) for item in value)
+    return value
+
+
+def _preload_models() -> None:
+    """Worker process initializer: load and warm the CPU-bound validators."""
+    if settings.WARMUP_VALIDATORS:
+        guardrail_validator.warm_validators(validator_config.CPU_BOUND_VALIDATORS)
+    else:
+        for validator_name in validator_config.CPU_BOUND_VALIDATORS:
+            guardrail_validator._load_validator_class(validator_name)
+
+
+def _validate_in_worker(
+    text: str,
+    guardrail_config: GuardrailConfig
+) -> Optional[FailedGuardrail]:
+    """
+    Validate text against a single guardrail inside a worker process.
+
+    The worker resolves the validator and caches the instance in its own
+    GuardrailValidator, so each process loads a given model only once.
+    """
+    validator_class = guardrail_validator._load_validator_class(guardrail_config.name)
+    if validator_class is None:
+        return FailedGuardrail(
+            name=guardrail_config.name,
+            error=f"Validator '{guardrail_config.name}' not found"
+        )
+    return guardrail_validator._validate_single(text, guardrail_config, validator_class)
 
 
 class GuardrailValidator:
     """Handles dynamic loading and validation of guardrails."""
 
     def __init__(self):
+        # Validator classes by name, for the validators that were found
         self.validator_cache: Dict[str, Any] = {}
+        # Names of validators that were not found (values are unused)
+        self._missing_validators: LRUCache = LRUCache(maxsize=_MISSING_CACHE_SIZE)
+        # Whether each validator's constructor takes an on_fail argument
+        self._accepts_on_fail: Dict[str, bool] = {}
+        # Validator instances by (name, config), bounded because the configs
+        # come from clients; validators run through a Guard (see _uses_guard)
+        # are stored wrapped in their Guard
+        self._validator_cache: LRUCache = LRUCache(
+            maxsize=max(settings.VALIDATOR_CACHE_SIZE, 1)
+        )
+        # The same for validators in MODEL_VALIDATORS, whose instances each
+        # hold a model and are therefore kept in far smaller numbers
+        self._model_validator_cache: LRUCache = LRUCache(
+            maxsize=max(settings.MODEL_VALIDATOR_CACHE_SIZE, 1)
+        )
+        # Guards the LRU caches and _build_locks, never held while building
+        self._validator_lock = threading.Lock()
+        # Locks for the keys being built, so a slow model load only blocks
+        # requests waiting for that same validator
+        self._build_locks: Dict[Tuple[str, frozenset], threading.Lock] = {}
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        self._cpu_workers = 0
 
     def _load_validator_class(self, validator_name: str) -> Optional[Any]:
         """
@@ -27,14 +123,18 @@ class GuardrailValidator:
         Returns:
             Validator class or None if not found
         """
-        # Check cache first
-        if validator_name in self.validator_cache:
-            return self.validator_cache[validator_name]
+        # Check cache first. dict.get and item assignment are atomic, so no
+        # lock is needed for found classes.
+        validator_class = self.validator_cache.get(validator_name)
+        if validator_class is not None:
+            return validator_class
+        with self._validator_lock:
+            if self._missing_validators.get(validator_name):
+                return None
 
         try:
             # Try to import from guardrails.hub
-            hub_module = importlib.import_module("guardrails.hub")
-            validator_class = getattr(hub_module, validator_name, None)
+            validator_class = getattr(_HUB, validator_name, None)
 
             if validator_class:
                 self.validator_cache[validator_name] = validator_class
@@ -55,19 +155,21 @@ class GuardrailValidator:
         except (ImportError, AttributeError):
             pass
 
+        # Remember the miss so repeated lookups skip both import attempts
+        with self._validator_lock:
+            self._missing_validators[validator_name] = True
         return None
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _camel_to_snake(name: str) -> str:
         """Convert CamelCase to snake_case."""
-        import re
-        name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+        return _CAMEL2.sub(r'\1_\2', _CAMEL1.sub(r'\1_\2', name)).lower()
 
     def validate_guardrail_config(
         self,
         guardrail: GuardrailConfig
-    ) -> Tuple[bool, str]:
+    ) -> Tuple[bool, str, Optional[Any]]:
         """
         Validate that a guardrail configuration is valid.
 
@@ -75,12 +177,12 @@ class GuardrailValidator:
             guardrail: Guardrail configuration to validate
 
         Returns:
-            tuple: (is_valid, error_message)
+            tuple: (is_valid, error_message, validator_class)
         """
         # Check if validator exists
         validator_class = self._load_validator_class(guardrail.name)
         if validator_class is None:
-            return False, f"Validator '{guardrail.name}' not found. Make sure it's installed from Guardrails Hub."
+            return False, f"Validator '{guardrail.name}' not found. Make sure it's installed from Guardrails Hub.", None
 
         # Validate required configuration parameters
         is_valid, error_msg = validator_config.validate_config(
@@ -88,113 +190,399 @@ class GuardrailValidator:
             guardrail.config
         )
 
-        return is_valid, error_msg
+        return is_valid, error_msg, validator_class
+
+    def start_process_pool(self, max_workers: int) -> None:
+        """
+        Start the worker process pool used for CPU-bound validators.
+
+        Args:
+            max_workers: Number of worker processes; 0 keeps every validator
+                in the thread pool
+        """
+        if self._cpu_pool is not None or max_workers <= 0:
+            return
+        # Spawn rather than fork: the parent already runs threads
+        self._cpu_pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_preload_models,
+        )
+        self._cpu_workers = max_workers
+
+    def _restart_process_pool(self, broken_pool: ProcessPoolExecutor) -> None:
+        """
+        Replace a worker process pool that broke because a worker died.
+
+        A broken ProcessPoolExecutor rejects every later submission, so it is
+        swapped for a fresh pool; requests that already hold the new pool
+        leave it alone.
+
+        Args:
+            broken_pool: Pool that raised BrokenProcessPool
+        """
+        if self._cpu_pool is not broken_pool:
+            return
+        logger.error("A validator worker process died; restarting the process pool")
+        self._cpu_pool = None
+        broken_pool.shutdown(wait=False, cancel_futures=True)
+        self.start_process_pool(self._cpu_workers)
+
+    def shutdown_process_pool(self) -> None:
+        """Shut down the worker process pool, if it was started."""
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(cancel_futures=True)
+            self._cpu_pool = None
+
+    def warm_validators(self, validator_names: Iterable[str]) -> None:
+        """
+        Load validators ahead of the first request that uses them.
+
+        Validators with an entry in WARMUP_CONFIGS are also built with that
+        config and run once, so their models are in memory and the warmed
+        instance is cached for requests using the same config.
+
+        Args:
+            validator_names: Names of the validators to load
+        """
+        for validator_name in validator_names:
+            validator_class = self._load_validator_class(validator_name)
+            config = validator_config.WARMUP_CONFIGS.get(validator_name)
+            if validator_class is None or config is None:
+                continue
+
+            try:
+                validator = self._get_validator(
+                    validator_class,
+                    GuardrailConfig(name=validator_name, config=config)
+                )
+                self._run_validator(validator, "warmup")
+            except Exception as e:
+                logger.warning("Could not warm up validator %s: %s", validator_name, e)
+
+    async def warm_up(self) -> None:
+        """
+        Warm the common validators at startup, in this process and in every
+        worker process of the CPU-bound pool.
+        """
+        loop = asyncio.get_running_loop()
+        validator_names = set(validator_config.COMMON_VALIDATORS)
+        tasks = []
+
+        if self._cpu_pool is not None:
+            # CPU-bound validators run in the workers; loading their classes
+            # here is enough to resolve them. One task per worker makes the
+            # pool start all of them, each warming up in its initializer.
+            for validator_name in validator_names & validator_config.CPU_BOUND_VALIDATORS:
+                self._load_validator_class(validator_name)
+            validator_names -= validator_config.CPU_BOUND_VALIDATORS
+            tasks.extend(
+                loop.run_in_executor(self._cpu_pool, os.getpid)
+                for _ in range(self._cpu_workers)
+            )
+
+        tasks.append(
+            loop.run_in_executor(_executor, self.warm_validators, validator_names)
+        )
+        await asyncio.gather(*tasks)
+
+    def _build_validator(
+        self,
+        validator_name: str,
+        validator_class: Any,
+        config: Dict[str, Any]
+    ) -> Any:
+        """
+        Instantiate a validator with its config and OnFailAction.EXCEPTION.
+
+        Validators with a faster replacement in app.fast_validators are built
+        from that replacement instead of the hub class. With QUANTIZE_MODELS
+        enabled, transformer models of quantizable validators are swapped for
+        int8 versions.
 
-    def validate_text(
+        Args:
+            validator_name: Name of the guardrail validator
+            validator_class: Validator class to instantiate
+            config: Configuration parameters for the validator
+
+        Returns:
+            Validator instance
+        """
+        validator_class = FAST_VALIDATORS.get(validator_name, validator_class)
+
+        accepts_on_fail = self._accepts_on_fail.get(validator_name)
+        if accepts_on_fail is None:
+            parameters = inspect.signature(validator_class.__init__).parameters
+            accepts_on_fail = "on_fail" in parameters or any(
+                parameter.kind == inspect.Parameter.VAR_KEYWORD
+                for parameter in parameters.values()
+            )
+            self._accepts_on_fail[validator_name] = accepts_on_fail
+
+        if accepts_on_fail:
+            validator_instance = validator_class(
+                **config,
+                on_fail=OnFailAction.EXCEPTION
+            )
+        else:
+            validator_instance = validator_class(**config)
+            # Manually set on_fail if the class supports it
+            if hasattr(validator_instance, 'on_fail'):
+                validator_instance.on_fail = OnFailAction.EXCEPTION
+
+        if (
+            settings.QUANTIZE_MODELS
+            and validator_name in validator_config.QUANTIZABLE_VALIDATORS
+        ):
+            quantize_validator_models(validator_instance)
+
+        return validator_instance
+
+    @staticmethod
+    def _uses_guard(validator_name: str) -> bool:
+        """Whether a validator is run through a Guard instead of directly."""
+        return (
+            settings.VALIDATE_WITH_GUARD
+            or validator_name in validator_config.GUARD_WRAPPED_VALIDATORS
+        )
+
+    def _get_validator(
         self,
-        text: str,
-        guardrails: List[GuardrailConfig]
-    ) -> Tuple[bool, List[FailedGuardrail]]:
+        validator_class: Any,
+        guardrail_config: GuardrailConfig
+    ) -> Any:
         """
-        Validate text against all specified guardrails.
+        Get a ready validator for a guardrail, building it on first use.
+
+        Validators such as ToxicLanguage load a model in their constructor, so
+        instances are cached per (name, config) and reused across requests. Each
+        key is built under its own lock, so concurrent requests for a validator
+        wait for one build while requests for other validators carry on.
 
         Args:
-            text: Text to validate
-            guardrails: List of guardrail configurations
+            validator_class: Validator class for the guardrail
+            guardrail_config: Guardrail configuration to apply
 
         Returns:
-            tuple: (all_passed, list_of_failed_guardrails)
+            Validator instance, or a Guard using it for Guard-wrapped validators
         """
-        failed_guardrails: List[FailedGuardrail] = []
+        key = (guardrail_config.name, freeze_config(guardrail_config.config))
+        if guardrail_config.name in validator_config.MODEL_VALIDATORS:
+            cache = self._model_validator_cache
+        else:
+            cache = self._validator_cache
+
+        with self._validator_lock:
+            validator = cache.get(key)
+            if validator is not None:
+                return validator
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            with self._validator_lock:
+                validator = cache.get(key)
+            if validator is not None:
+                return validator
 
-        # Validate each guardrail individually to collect all failures
-        for guardrail_config in guardrails:
             try:
-                # Create a new Guard for each guardrail
-                guard = Guard()
-
-                # Load validator class
-                validator_class = self._load_validator_class(guardrail_config.name)
-                if validator_class is None:
-                    failed_guardrails.append(
-                        FailedGuardrail(
-                            name=guardrail_config.name,
-                            error=f"Validator '{guardrail_config.name}' not found"
-                        )
-                    )
-                    continue
-
-                # Initialize validator with config and OnFailAction.EXCEPTION
-                try:
-                    validator_instance = validator_class(
-                        **guardrail_config.config,
-                        on_fail=OnFailAction.EXCEPTION
-                    )
-                except TypeError as e:
-                    # Handle case where on_fail is not a valid parameter
-                    try:
-                        validator_instance = validator_class(**guardrail_config.config)
-                        # Manually set on_fail if the class supports it
-                        if hasattr(validator_instance, 'on_fail'):
-                            validator_instance.on_fail = OnFailAction.EXCEPTION
-                    except Exception as init_error:
-                        failed_guardrails.append(
-                            FailedGuardrail(
-                                name=guardrail_config.name,
-                                error=f"Error initializing validator: {str(init_error)}"
-                            )
-                        )
-                        continue
-
-                # Add validator to guard
-                guard.use(validator_instance)
-
-                # Validate the text
-                guard.validate(text)
+                validator = self._build_validator(
+                    guardrail_config.name,
+                    validator_class,
+                    guardrail_config.config
+                )
+                if self._uses_guard(guardrail_config.name):
+                    validator = Guard().use(validator)
+                with self._validator_lock:
+                    cache[key] = validator
+            finally:
+                with self._validator_lock:
+                    self._build_locks.pop(key, None)
+
+        return validator
+
+    @staticmethod
+    def _run_validator(validator: Any, text: str) -> Optional[str]:
+        """
+        Run a cached validator against text.
 
+        Validators are called directly, skipping the Guard's history, telemetry
+        and reask handling; Guard-wrapped validators go through guard.validate().
+
+        Args:
+            validator: Validator instance or Guard from _get_validator
+            text: Text to validate
+
+        Returns:
+            Error message if the validation failed, None if it passed
+        """
+        if isinstance(validator, Guard):
+            try:
+                validator.validate(text)
             except ValidationError as e:
-                # Validation failed - extract error message
-                error_message = str(e)
-                failed_guardrails.append(
-                    FailedGuardrail(
-                        name=guardrail_config.name,
-                        error=error_message
-                    )
-                )
-            except Exception as e:
-                # Handle any other unexpected errors
-                error_message = f"Unexpected error during validation: {str(e)}"
-                failed_guardrails.append(
-                    FailedGuardrail(
-                        name=guardrail_config.name,
-                        error=error_message
-                    )
-                )
+                return str(e)
+            return None
+
+        result = validator.validate(text, {})
+        if isinstance(result, FailResult):
+            return result.error_message
+        return None
+
+    def _validate_single(
+        self,
+        text: str,
+        guardrail_config: GuardrailConfig,
+        validator_class: Any
+    ) -> Optional[FailedGuardrail]:
+        """
+        Validate text against a single guardrail.
+
+        Args:
+            text: Text to validate
+            guardrail_config: Guardrail configuration to apply
+            validator_class: Validator class resolved for the guardrail
+
+        Returns:
+            FailedGuardrail if the validation failed, None if it passed
+        """
+        try:
+            validator = self._get_validator(validator_class, guardrail_config)
+        except Exception as init_error:
+            return FailedGuardrail.from_error(
+                name=guardrail_config.name,
+                error=f"Error initializing validator: {str(init_error)}"
+            )
 
-        all_passed = len(failed_guardrails) == 0
-        return all_passed, failed_guardrails
+        try:
+            # Validate the text
+            error_message = self._run_validator(validator, text)
+        except TimeoutError as e:
+            return FailedGuardrail.from_error(name=guardrail_config.name, error=str(e))
+        except Exception as e:
+            # Handle any other unexpected errors
+            return FailedGuardrail.from_error(
+                name=guardrail_config.name,
+                error=f"Unexpected error during validation: {str(e)}"
+            )
+
+        if error_message is None:
+            return None
+        return FailedGuardrail(name=guardrail_config.name, error=error_message)
+
+    async def _validate_in_pool(
+        self,
+        cpu_pool: ProcessPoolExecutor,
+        text: str,
+        guardrail_config: GuardrailConfig
+    ) -> Optional[FailedGuardrail]:
+        """
+        Validate text against a single guardrail in the worker process pool.
 
-    def validate_all_configs(
+        If a worker dies (out of memory, a crash in native code) the guardrail
+        is reported as failed and the pool is restarted for later requests.
+
+        Args:
+            cpu_pool: Worker process pool to run the guardrail in
+            text: Text to validate
+            guardrail_config: Guardrail configuration to apply
+
+        Returns:
+            FailedGuardrail if the validation failed, None if it passed
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                cpu_pool,
+                _validate_in_worker,
+                text,
+                guardrail_config
+            )
+        except BrokenProcessPool as e:
+            self._restart_process_pool(cpu_pool)
+            return FailedGuardrail.from_error(
+                name=guardrail_config.name,
+                error=f"Unexpected error during validation: {str(e)}"
+            )
+
+    async def validate_text(
+        self,
+        text: str,
+        guardrails: List[Tuple[GuardrailConfig, Any]]
+    ) -> Tuple[bool, List[FailedGuardrail]]:
+        """
+        Validate text against all specified guardrails.
+
+        Guardrails are run concurrently, so the total time is roughly that of
+        the slowest validator rather than the sum of all of them. CPU-bound
+        validators go to the worker process pool when it is running, and the
+        rest to the thread pool.
+
+        Args:
+            text: Text to validate
+            guardrails: (guardrail_config, validator_class) pairs as returned
+                by resolve_and_validate_configs
+
+        Returns:
+            tuple: (all_passed, list_of_failed_guardrails)
+        """
+        loop = asyncio.get_running_loop()
+        cpu_pool = self._cpu_pool
+
+        # Validate each guardrail individually to collect all failures. Each one
+        # keeps its own cached validator rather than sharing a single Guard for
+        # the request: validators are built once and reused, they run in
+        # parallel, and every failure maps back to the guardrail that raised it,
+        # even when the same validator appears twice with different configs.
+        tasks = []
+        for guardrail_config, validator_class in guardrails:
+            if (
+                cpu_pool is not None
+                and guardrail_config.name in validator_config.CPU_BOUND_VALIDATORS
+            ):
+                tasks.append(self._validate_in_pool(cpu_pool, text, guardrail_config))
+            else:
+                tasks.append(loop.run_in_executor(
+                    _executor,
+                    self._validate_single,
+                    text,
+                    guardrail_config,
+                    validator_class
+                ))
+
+        results = await asyncio.gather(*tasks)
+
+        failed_guardrails = [result for result in results if result is not None]
+        return not failed_guardrails, failed_guardrails
+
+    def resolve_and_validate_configs(
         self,
         guardrails: List[GuardrailConfig]
-    ) -> Tuple[bool, List[str]]:
+    ) -> Tuple[bool, List[str], List[Tuple[GuardrailConfig, Any]]]:
         """
         Validate all guardrail configurations before running validation.
 
+        Each validator class is resolved once here and handed on to
+        validate_text, so it is not looked up a second time.
+
         Args:
             guardrails: List of guardrail configurations to validate
 
         Returns:
-            tuple: (all_valid, list_of_error_messages)
+            tuple: (all_valid, list_of_error_messages,
+                list_of_(guardrail_config, validator_class)_pairs)
         """
         errors = []
+        resolved = []
 
         for guardrail in guardrails:
-            is_valid, error_msg = self.validate_guardrail_config(guardrail)
+            is_valid, error_msg, validator_class = self.validate_guardrail_config(
+                guardrail
+            )
             if not is_valid:
                 errors.append(f"{guardrail.name}: {error_msg}")
+            else:
+                resolved.append((guardrail, validator_class))
 
-        return len(errors) == 0, errors
+        return len(errors) == 0, errors, resolved
 
 
 # Create a singleton instance
@@ -0,0 +1,128 @@
+"""
+Shared fixtures for the test suite.
+
+Hub validators are not installed in the test environment, so small stand-ins
+with the same constructor arguments and error messages are registered on
+guardrails.hub before the app is imported.
+"""
+
+import os
+import re
+import threading
+
+# Keep every validator in this process and skip model warm-up
+os.environ.setdefault("CPU_WORKERS", "0")
+os.environ.setdefault("WARMUP_VALIDATORS", "false")
+
+import guardrails.hub
+import pytest
+from cachetools import LRUCache
+from guardrails.validator_base import (
+    FailResult,
+    PassResult,
+    Validator,
+    register_validator,
+)
+
+from app.config import settings
+from app.main import _response_cache
+from app.validators import guardrail_validator
+
+
+@register_validator(name="tests/regex_match", data_type="string")
+class RegexMatch(Validator):
+    """Upstream RegexMatch: stdlib re, fullmatch unless told otherwise."""
+
+    def __init__(self, regex, match_type=None, on_fail=None):
+        super().__init__(on_fail=on_fail, regex=regex, match_type=match_type)
+        self._regex = regex
+        self._match_type = match_type or "fullmatch"
+
+    def _validate(self, value, metadata):
+        if not getattr(re.compile(self._regex), self._match_type)(value):
+            return FailResult(error_message=f"Result must match {self._regex}")
+        return PassResult()
+
+
+@register_validator(name="tests/competitor_check", data_type="string")
+class CompetitorCheck(Validator):
+    """
+    Upstream CompetitorCheck without the NER step: a competitor is flagged when
+    its lowercased, word-bounded pattern occurs in the lowercased text.
+    """
+
+    calls = 0
+
+    def __init__(self, competitors, on_fail=None):
+        super().__init__(on_fail=on_fail, competitors=competitors)
+        self._competitors = competitors
+
+    def _validate(self, value, metadata):
+        CompetitorCheck.calls += 1
+        found = [
+            competitor
+            for competitor in self._competitors
+            if re.search(rf"\b{re.escape(competitor)}\b".lower(), value.lower())
+        ]
+        if found:
+            return FailResult(
+                error_message=f"Found the following competitors: {found}"
+            )
+        return PassResult()
+
+
+@register_validator(name="tests/slow_build", data_type="string")
+class SlowBuild(Validator):
+    """Validator whose constructor blocks until `release` is set, like a model load."""
+
+    builds = 0
+    started = threading.Event()
+    release = threading.Event()
+
+    def __init__(self, on_fail=None):
+        super().__init__(on_fail=on_fail)
+        SlowBuild.builds += 1
+        SlowBuild.started.set()
+        SlowBuild.release.wait(timeout=10)
+
+    def _validate(self, value, metadata):
+        return PassResult()
+
+
+@register_validator(name="tests/broken", data_type="string")
+class Broken(Validator):
+    """Validator that raises instead of returning a result."""
+
+    calls = 0
+
+    def __init__(self, on_fail=None):
+        super().__init__(on_fail=on_fail)
+
+    def _validate(self, value, metadata):
+        Broken.calls += 1
+        raise RuntimeError("model unavailable")
+
+
+for _validator in (RegexMatch, CompetitorCheck, SlowBuild, Broken):
+    setattr(guardrails.hub, _validator.__name__, _validator)
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Start every test with empty validator and response caches."""
+    guardrail_validator.validator_cache.clear()
+    guardrail_validator._missing_validators.clear()
+    guardrail_validator._validator_cache = LRUCache(
+        maxsize=max(settings.VALIDATOR_CACHE_SIZE, 1)
+    )
+    guardrail_validator._model_validator_cache = LRUCache(
+        maxsize=max(settings.MODEL_VALIDATOR_CACHE_SIZE, 1)
+    )
+    _response_cache.clear()
+    CompetitorCheck.calls = 0
+    Broken.calls = 0
+    SlowBuild.builds = 0
+    SlowBuild.started.clear()
+    SlowBuild.release.clear()
+    yield
+    SlowBuild.release.set()
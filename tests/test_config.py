@@ -0,0 +1,32 @@
+"""
+Tests for the settings defaults.
+"""
+
+import os
+
+import pytest
+
+from app import config
+
+
+@pytest.fixture
+def affinity(monkeypatch):
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(64)), raising=False)
+
+
+def test_available_cpus_follows_the_cgroup_quota(monkeypatch, tmp_path, affinity):
+    cpu_max = tmp_path / "cpu.max"
+    cpu_max.write_text("200000 100000\n")
+    monkeypatch.setattr(config, "_CGROUP_CPU_MAX", str(cpu_max))
+
+    assert config._available_cpus() == 2
+
+
+def test_available_cpus_without_a_quota(monkeypatch, tmp_path, affinity):
+    cpu_max = tmp_path / "cpu.max"
+    cpu_max.write_text("max 100000\n")
+    monkeypatch.setattr(config, "_CGROUP_CPU_MAX", str(cpu_max))
+    assert config._available_cpus() == 64
+
+    monkeypatch.setattr(config, "_CGROUP_CPU_MAX", str(tmp_path / "missing"))
+    assert config._available_cpus() == 64
@@ -0,0 +1,193 @@
+"""
+Tests for the faster replacements of hub validators.
+"""
+
+import re
+import sys
+import time
+import warnings
+
+import pytest
+from guardrails.validator_base import PassResult
+
+from app.config import settings
+from app.fast_validators import (
+    FAST_VALIDATORS,
+    FastCompetitorCheck,
+    FastRegexMatch,
+    _competitor_matcher,
+)
+from app.models import GuardrailConfig
+from app.validators import guardrail_validator
+from tests.conftest import CompetitorCheck
+
+PATTERNS = [
+    r"^\w+$",
+    r"\w+",
+    r"\W",
+    r"(?i)stra(ss|ß)e",
+    r"\d+",
+    r"abc$",
+    r"(?m)^abc$",
+    r"\bfoo\b",
+    r"\s+",
+    r"\S+",
+    r"[^\s]+",
+    r"a\s?b",
+    r"a{,3}",
+    r"[[:alpha:]]+",
+    r"(?i)k+",
+    r"(?i)[a-z]+",
+    r"[^a]+",
+    r"caf.",
+    r"(a)\1",
+    r"(\w)\1",
+    r"\(?(\d{3})\)?[- ]?(\d{3})[- ]?(\d{4})",
+    r"[a-z]+@[a-z]+\.com",
+]
+
+# Every ASCII character on its own, plus longer texts; the engines must agree
+# with re on all of these
+TEXTS = [chr(code) for code in range(128)] + [
+    "café",
+    "STRASSE",
+    "straße",
+    "٣٤",
+    "1234",
+    "abc",
+    "abc\n",
+    "abc\nabc",
+    "foo",
+    "éfoo",
+    "a foo b",
+    "a\x1cb",
+    "a\x0bb",
+    " \t",
+    "aa",
+    "KK",
+    "123-456-7890",
+    "me@example.com",
+]
+
+
+@pytest.mark.parametrize("match_type", ["fullmatch", "search"])
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_regex_match_agrees_with_re(pattern, match_type):
+    validator = FastRegexMatch(regex=pattern, match_type=match_type)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        compiled = re.compile(pattern)
+
+    for text in TEXTS:
+        expected = getattr(compiled, match_type)(text) is not None
+        result = validator.validate(text, {})
+        assert isinstance(result, PassResult) == expected, (pattern, text)
+
+
+def test_regex_match_uses_regex_unicode_tables_for_other_text():
+    # A combining mark is a word character for the regex module, not for re
+    result = FastRegexMatch(regex=r"^\w+$").validate("cafe\u0301", {})
+
+    assert isinstance(result, PassResult)
+
+
+def test_regex_match_error_message():
+    result = FastRegexMatch(regex=r"\d+").validate("abc", {})
+
+    assert result.error_message == r"Result must match \d+"
+
+
+def test_regex_match_rejects_invalid_pattern():
+    with pytest.raises(re.error):
+        FastRegexMatch(regex=r"(?<name>a)")
+
+
+@pytest.mark.parametrize("pattern, text", [
+    (r"^(\d+)+$", "1" * 30 + "x"),
+    (r"^(\d+)+$", "١" * 30 + "x"),
+    (r"^(\w+\s?)*$", "ab " * 30 + "\u0301"),
+    (r"(?i)^(a+)+$", "a" * 30 + "ı"),
+    (r"^(a|aa)+\1$", "a" * 40 + "!"),
+])
+def test_regex_match_is_bounded(pattern, text):
+    validator = FastRegexMatch(regex=pattern, match_type="search")
+
+    started = time.monotonic()
+    try:
+        validator.validate(text, {})
+    except TimeoutError:
+        pass
+
+    assert time.monotonic() - started < settings.REGEX_TIMEOUT + 0.5
+
+
+def test_regex_timeout_fails_guardrail_as_error():
+    guardrail = GuardrailConfig(name="RegexMatch", config={"regex": r"^(a|aa)+\1$"})
+
+    failed = guardrail_validator._validate_single("a" * 40 + "!", guardrail, None)
+
+    assert failed.error == r"Timed out matching ^(a|aa)+\1$"
+    assert failed.is_error
+
+
+COMPETITOR_CASES = [
+    (["Acme"], "ACME makes widgets"),
+    (["acme"], "We bought it from Acme."),
+    (["Acme"], "Acmeville is a town"),
+    (["Acme Corp"], "We switched from ACME CORP last year"),
+    (["Acme Corp"], "Acme is not Acme  Corp"),
+    (["Globex", "Acme Corp"], "acme corp and GLOBEX both bid"),
+    (["İstanbul Tech"], "İSTANBUL TECH is hiring"),
+    (["İstanbul Tech"], "istanbul tech is hiring"),
+    (["Straße"], "STRASSE und straße"),
+    (["ΟΔΥΣ"], "Ο ΟΔΥΣ. Τέλος"),
+    (["Kelvin K"], "kelvin \u212a"),
+    (["Acme"], "Nothing to see here"),
+]
+
+
+def _hub_flags(competitors, text):
+    return CompetitorCheck(competitors=competitors).validate(text, {})
+
+
+@pytest.mark.parametrize("competitors, text", COMPETITOR_CASES)
+def test_competitor_check_matches_hub(competitors, text):
+    expected = _hub_flags(competitors, text)
+
+    result = FastCompetitorCheck(competitors=competitors).validate(text, {})
+
+    assert type(result) is type(expected)
+    assert getattr(result, "error_message", None) == getattr(expected, "error_message", None)
+
+
+def test_competitor_check_skips_hub_without_mention():
+    validator = FastCompetitorCheck(competitors=["Acme", "Globex"])
+    CompetitorCheck.calls = 0
+
+    assert isinstance(validator.validate("A text about widgets", {}), PassResult)
+    assert CompetitorCheck.calls == 0
+
+
+def test_competitor_prefilter_never_misses_a_cased_letter():
+    # Every letter with case forms, as a one-letter name and in a few contexts
+    letters = [
+        chr(code)
+        for code in range(sys.maxunicode + 1)
+        if not 0xD800 <= code <= 0xDFFF
+        and (chr(code).lower() != chr(code) or chr(code).upper() != chr(code))
+    ]
+    for letter in letters:
+        forms = {letter, letter.lower(), letter.upper(), letter.title()}
+        for name in forms:
+            mentions_competitor = _competitor_matcher((name,))
+            for form in forms:
+                for text in (form, f"a {form}", f"ΑΣ{form} b"):
+                    if re.search(rf"\b{re.escape(name)}\b".lower(), text.lower()):
+                        assert mentions_competitor(text), (name, text)
+
+
+@pytest.mark.parametrize("validator_class", FAST_VALIDATORS.values())
+def test_fast_validators_keep_guardrails_validate(validator_class):
+    # Guardrails wraps _validate() in validate(), which must not be overridden
+    assert "validate" not in vars(validator_class)
+    assert "_validate" in vars(validator_class)
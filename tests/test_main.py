@@ -0,0 +1,93 @@
+"""
+Tests for the /validate endpoint.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+from tests.conftest import Broken, CompetitorCheck
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def _validate(client, text, *guardrails):
+    return client.post(
+        "/validate",
+        json={
+            "text": text,
+            "guardrails": [
+                {"name": name, "config": config} for name, config in guardrails
+            ],
+        },
+    )
+
+
+def test_failed_response_is_cached(client):
+    guardrail = ("CompetitorCheck", {"competitors": ["Acme"]})
+
+    first = _validate(client, "Acme is great", guardrail)
+    second = _validate(client, "Acme is great", guardrail)
+
+    assert first.status_code == 200
+    assert first.json()["passed"] is False
+    assert second.json() == first.json()
+    assert CompetitorCheck.calls == 1
+
+
+def test_error_response_is_not_cached(client):
+    guardrails = [("Broken", {}), ("RegexMatch", {"regex": "a+"})]
+
+    first = _validate(client, "aaa", *guardrails)
+    second = _validate(client, "aaa", *guardrails)
+
+    assert first.json() == {
+        "passed": False,
+        "failed_guardrails": [
+            {"name": "Broken", "error": "Unexpected error during validation: model unavailable"},
+        ],
+    }
+    assert second.json() == first.json()
+    assert Broken.calls == 2
+
+
+def test_passing_request(client):
+    response = _validate(client, "café 123", ("RegexMatch", {"regex": "caf. \\d+"}))
+
+    assert response.status_code == 200
+    assert response.json() == {"passed": True, "failed_guardrails": []}
+
+
+def test_malformed_json_returns_422(client):
+    response = client.post(
+        "/validate",
+        content=b'{"text": "hello", "guardrails": [',
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_direct_call_returns_validator_error(client):
+    response = _validate(client, "abc", ("RegexMatch", {"regex": "\\d+"}))
+
+    assert response.json()["failed_guardrails"] == [
+        {"name": "RegexMatch", "error": "Result must match \\d+"},
+    ]
+
+
+def test_guard_wrapped_validator_error(client, monkeypatch):
+    monkeypatch.setattr(settings, "VALIDATE_WITH_GUARD", True)
+
+    response = _validate(client, "abc", ("RegexMatch", {"regex": "\\d+"}))
+
+    [failed] = response.json()["failed_guardrails"]
+    assert failed["name"] == "RegexMatch"
+    assert failed["error"].startswith("Validation failed for field with errors:")
+    assert "Result must match \\d+" in failed["error"]
@@ -0,0 +1,85 @@
+"""
+Tests for quantizing the transformers models held by validators.
+"""
+
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from app import quantization
+from app.quantization import quantize_validator_models
+
+
+class _Pipeline(transformers.Pipeline):
+    """Pipeline holding a model, without the tokenizer a real one would load."""
+
+    def __init__(self, model):
+        self.model = model
+
+    def _sanitize_parameters(self, **kwargs):
+        return {}, {}, {}
+
+    def preprocess(self, inputs):
+        return inputs
+
+    def _forward(self, model_inputs):
+        return self.model(**model_inputs)
+
+    def postprocess(self, model_outputs):
+        return model_outputs
+
+
+class _Validator:
+    def __init__(self):
+        self._pipeline = _Pipeline(_tiny_model())
+
+
+def _tiny_model():
+    config = transformers.BertConfig(
+        vocab_size=32,
+        hidden_size=8,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        intermediate_size=16,
+        name_or_path="tests/tiny-bert",
+    )
+    return transformers.BertForSequenceClassification(config).eval()
+
+
+@pytest.fixture(autouse=True)
+def clear_quantized_models():
+    quantization._quantized_models.clear()
+    yield
+    quantization._quantized_models.clear()
+
+
+def _linear_layers(model, layer_type):
+    return [module for module in model.modules() if type(module) is layer_type]
+
+
+def test_pipeline_model_is_swapped_for_a_quantized_copy():
+    validator = _Validator()
+    original = validator._pipeline.model
+
+    quantize_validator_models(validator)
+
+    quantized = validator._pipeline.model
+    assert quantized is not original
+    assert not _linear_layers(quantized, torch.nn.Linear)
+    assert _linear_layers(quantized, torch.ao.nn.quantized.dynamic.Linear)
+    assert _linear_layers(original, torch.nn.Linear)
+
+    inputs = {"input_ids": torch.tensor([[1, 2, 3]])}
+    with torch.no_grad():
+        assert quantized(**inputs).logits.shape == original(**inputs).logits.shape
+
+
+def test_validators_with_the_same_model_share_the_quantized_copy():
+    first, second = _Validator(), _Validator()
+
+    quantize_validator_models(first)
+    quantize_validator_models(second)
+
+    assert second._pipeline.model is first._pipeline.model
+    assert list(quantization._quantized_models) == ["tests/tiny-bert"]
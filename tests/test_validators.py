@@ -0,0 +1,125 @@
+"""
+Tests for GuardrailValidator.
+"""
+
+import asyncio
+import os
+import threading
+
+from cachetools import LRUCache
+
+from app import validators
+from app.config import validator_config
+from app.models import GuardrailConfig
+from app.validators import guardrail_validator
+from tests.conftest import RegexMatch, SlowBuild
+
+
+def _get(name, config, validator_class):
+    return guardrail_validator._get_validator(
+        validator_class,
+        GuardrailConfig(name=name, config=config)
+    )
+
+
+def test_validator_cache_reuses_instances():
+    first = _get("RegexMatch", {"regex": "a+"}, RegexMatch)
+    second = _get("RegexMatch", {"regex": "a+"}, RegexMatch)
+
+    assert first is second
+
+
+def test_validator_cache_stays_bounded(monkeypatch):
+    monkeypatch.setattr(guardrail_validator, "_validator_cache", LRUCache(maxsize=8))
+
+    for threshold in range(100):
+        _get("RegexMatch", {"regex": f"a{{{threshold}}}"}, RegexMatch)
+
+    assert len(guardrail_validator._validator_cache) == 8
+    assert not guardrail_validator._build_locks
+
+
+def test_model_validators_have_their_own_smaller_cache(monkeypatch):
+    monkeypatch.setattr(validator_config, "MODEL_VALIDATORS", {"RegexMatch"})
+    monkeypatch.setattr(guardrail_validator, "_model_validator_cache", LRUCache(maxsize=2))
+
+    for threshold in range(10):
+        _get("RegexMatch", {"regex": f"a{{{threshold}}}"}, RegexMatch)
+
+    assert len(guardrail_validator._model_validator_cache) == 2
+    assert len(guardrail_validator._validator_cache) == 0
+
+
+def test_missing_validator_cache_stays_bounded():
+    for index in range(validators._MISSING_CACHE_SIZE * 3):
+        assert guardrail_validator._load_validator_class(f"NoSuchValidator{index}") is None
+
+    assert len(guardrail_validator._missing_validators) == validators._MISSING_CACHE_SIZE
+    assert None not in guardrail_validator.validator_cache.values()
+
+
+def test_missing_validator_is_not_looked_up_again(monkeypatch):
+    assert guardrail_validator._load_validator_class("NoSuchValidator") is None
+    monkeypatch.setattr(validators.importlib, "import_module", None)
+
+    assert guardrail_validator._load_validator_class("NoSuchValidator") is None
+
+
+def test_slow_build_does_not_block_other_validators():
+    builder = threading.Thread(target=_get, args=("SlowBuild", {}, SlowBuild))
+    builder.start()
+    try:
+        assert SlowBuild.started.wait(timeout=5)
+
+        done = threading.Event()
+        other = threading.Thread(
+            target=lambda: (_get("RegexMatch", {"regex": "a+"}, RegexMatch), done.set())
+        )
+        other.start()
+        assert done.wait(timeout=5)
+    finally:
+        SlowBuild.release.set()
+        builder.join()
+
+
+def test_concurrent_requests_build_a_validator_once():
+    threads = [
+        threading.Thread(target=_get, args=("SlowBuild", {}, SlowBuild))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    assert SlowBuild.started.wait(timeout=5)
+    SlowBuild.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert SlowBuild.builds == 1
+
+
+def _exit_worker(text, guardrail_config):
+    os._exit(1)
+
+
+def _pass_worker(text, guardrail_config):
+    return None
+
+
+def test_dead_worker_fails_guardrail_and_restarts_pool(monkeypatch):
+    guardrails = [(GuardrailConfig(name="ToxicLanguage", config={}), None)]
+    guardrail_validator.start_process_pool(1)
+    try:
+        broken_pool = guardrail_validator._cpu_pool
+        monkeypatch.setattr(validators, "_validate_in_worker", _exit_worker)
+
+        passed, failed = asyncio.run(guardrail_validator.validate_text("hi", guardrails))
+
+        assert not passed
+        assert failed[0].name == "ToxicLanguage"
+        assert failed[0].error.startswith("Unexpected error during validation")
+        assert guardrail_validator._cpu_pool is not broken_pool
+
+        monkeypatch.setattr(validators, "_validate_in_worker", _pass_worker)
+        assert asyncio.run(guardrail_validator.validate_text("hi", guardrails)) == (True, [])
+    finally:
+        guardrail_validator.shutdown_process_pool()